@@ -0,0 +1,29 @@
+"""
+JSON helpers shared by the report generator and the data update script.
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+
+def load_json(path):
+    """Read and decode a JSON file."""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(data, path):
+    """Encode data as 2-space indented JSON and write it to path."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
@@ -5,21 +5,66 @@ Generates a comprehensive PDF report analyzing kappa light chain measurements
 with pre- and post-venetoclax treatment modeling.
 """
 
+import hashlib
 import json
+import os
+import pickle
 import pandas as pd
 import numpy as np
+import matplotlib
+# Select the PDF backend before pyplot is imported so no Agg canvas is set up
+matplotlib.use("pdf", force=True)
 import matplotlib.pyplot as plt
+import scipy
 from scipy.optimize import curve_fit
 from matplotlib.backends.backend_pdf import PdfPages
 from datetime import datetime
 from pathlib import Path
 
+from json_io import load_json
+
+
+# Configure matplotlib for PDF output. All pages are vector output, so a
+# high dpi only inflates layout work.
+plt.rcParams.update({
+    "font.size": 9,
+    "axes.titlesize": 11,
+    "axes.labelsize": 9,
+    "legend.fontsize": 8,
+    "figure.dpi": 100,
+    "savefig.dpi": 100,
+})
+
+# Parsed inputs are cached here, keyed on the SHA-256 of data.json/notes.json.
+# Set KAPPA_NOCACHE=1 to bypass the cache.
+_cache_path = Path(".kappa_cache.pkl")
+# Bump when the layout of the cached entry changes
+_CACHE_VERSION = 1
+
+# Fitted model parameters are cached here, keyed on the fit inputs
+_fit_cache = Path(".kappa_fit.npz")
+
+# Digest of the inputs behind the last generated report, stored next to it
+_manifest_name = ".kappa_report.manifest"
+
+
+def gompertz(x, A, B, C):
+    """Gompertz curve y(t) = A·exp(-B·exp(-C·t))."""
+    return A * np.exp(-B * np.exp(-C * x))
+
+
+def gompertz_jac(x, A, B, C):
+    """Analytic Jacobian of gompertz() with respect to (A, B, C)."""
+    x = np.asarray(x, dtype=np.float64)
+    e = np.exp(-C * x)
+    g = np.exp(-B * e)
+    return np.stack([g, -A * g * e, A * B * g * e * x], axis=1)
+
 
 def load_data(data_file="data.json"):
     """Load measurement data from JSON file."""
     try:
-        with open(data_file, 'r') as f:
-            data = json.load(f)
+        data = load_json(data_file)
         return data
     except FileNotFoundError:
         raise FileNotFoundError(
@@ -34,8 +79,7 @@ def load_data(data_file="data.json"):
 def load_notes(notes_file="notes.json"):
     """Load analysis notes from JSON file."""
     try:
-        with open(notes_file, 'r') as f:
-            notes = json.load(f)
+        notes = load_json(notes_file)
         return notes
     except FileNotFoundError:
         raise FileNotFoundError(
@@ -47,120 +91,365 @@ def load_notes(notes_file="notes.json"):
         )
 
 
+def _build_df(measurements):
+    """Build the measurement DataFrame with derived columns."""
+    # Validate data
+    if not measurements:
+        raise ValueError("No measurements found in data file")
+
+    # Convert measurements to separate arrays
+    dates = [m["date"] for m in measurements]
+    kappa = np.asarray([m["kappa"] for m in measurements], dtype=np.float64)
+    lambda_ = np.asarray([m["lambda"] for m in measurements],
+                         dtype=np.float64)
+
+    # Compute derived columns in NumPy, then assemble the frame in one go
+    ratio = np.round(kappa / lambda_, 2)
+    delta = np.empty_like(kappa)
+    delta[0] = 0.0
+    delta[1:] = np.round(kappa[1:] - kappa[:-1], 1)
+    pct = np.empty_like(kappa)
+    pct[0] = 0.0
+    pct[1:] = np.round((kappa[1:] - kappa[:-1]) / kappa[:-1] * 100.0, 1)
+
+    df = pd.DataFrame({
+        "Date": pd.to_datetime(dates, format="%Y-%m-%d", cache=True),
+        "Kappa": kappa,
+        "Lambda": lambda_,
+        "Ratio": ratio,
+        "Delta": delta,
+        "% Change": np.char.mod("%.1f%%", pct)
+    })
+    return df
+
+
+def _input_digest(data_file="data.json", notes_file="notes.json"):
+    """SHA-256 of the data and notes files, or None if either is missing."""
+    try:
+        h = hashlib.sha256(Path(data_file).read_bytes())
+        h.update(Path(notes_file).read_bytes())
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
+def _report_manifest(input_digest, popt_g_pre, popt_g_post):
+    """Digest of everything that determines the rendered report."""
+    h = hashlib.sha256(input_digest.encode())
+    h.update(np.ascontiguousarray(popt_g_pre, dtype=np.float64).tobytes())
+    h.update(np.ascontiguousarray(popt_g_post, dtype=np.float64).tobytes())
+    # Changes to the report code itself also invalidate the output
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _input_cache_key(input_digest):
+    """
+    Key for the parsed-input cache: the input digest plus everything that
+    shapes the cached DataFrame (cache layout, library versions and this
+    script's code).
+    """
+    h = hashlib.sha256(input_digest.encode())
+    h.update(f"{_CACHE_VERSION}:{pd.__version__}:{np.__version__}".encode())
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
+
+
+def load_inputs(data_file="data.json", notes_file="notes.json"):
+    """
+    Load measurements, settings and notes, reusing the on-disk cache when
+    neither input file has changed since the last run.
+
+    Returns:
+        Tuple of (df, settings, notes_data, input_digest). input_digest
+        is the SHA-256 of both input files, or None when caching is
+        disabled with KAPPA_NOCACHE.
+    """
+    use_cache = not os.environ.get("KAPPA_NOCACHE")
+    digest = None
+    cache_key = None
+    if use_cache:
+        # A missing file leaves the key as None so load_data/load_notes
+        # raise their usual errors
+        digest = _input_digest(data_file, notes_file)
+        if digest is not None:
+            cache_key = _input_cache_key(digest)
+        if cache_key is not None and _cache_path.exists():
+            try:
+                with open(_cache_path, 'rb') as f:
+                    cached = pickle.load(f)
+                if cached.get("hash") == cache_key:
+                    return (cached["df"], cached["settings"],
+                            cached["notes"], digest)
+            except Exception:
+                pass  # Stale or unreadable cache; rebuild below
+
+    data = load_data(data_file)
+    notes_data = load_notes(notes_file)
+    settings = data["settings"]
+    df = _build_df(data["measurements"])
+
+    if cache_key is not None:
+        # Write to a temp file first so an interrupted save never leaves a
+        # truncated cache behind
+        tmp_path = _cache_path.with_name(_cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    {"hash": cache_key, "df": df, "settings": settings,
+                     "notes": notes_data},
+                    f, protocol=5
+                )
+            os.replace(tmp_path, _cache_path)
+        except OSError:
+            pass  # Caching is best-effort
+    return df, settings, notes_data, digest
+
+
+def fit_gompertz(x, y, p0=None):
+    """
+    Fit the Gompertz model to (x, y).
+
+    When p0 holds parameters from a previous fit of a prefix of the same
+    window, it is used as a warm start with the default evaluation
+    budget; otherwise (or if the warm start fails) the fit starts from a
+    generic seed.
+    """
+    if p0 is not None and len(p0) == 3:
+        try:
+            popt, _ = curve_fit(gompertz, x, y, p0=p0, jac=gompertz_jac)
+            with np.errstate(over='ignore', invalid='ignore'):
+                sse = np.sum((gompertz(x, *popt) - y) ** 2)
+            if np.all(np.isfinite(popt)) and np.isfinite(sse):
+                return popt
+        except (RuntimeError, ValueError):
+            pass  # Warm start did not converge; fall back to a cold fit
+    popt, _ = curve_fit(
+        gompertz, x, y, p0=[np.max(y), 1, 0.05], jac=gompertz_jac,
+        maxfev=10000
+    )
+    return popt
+
+
+def _fit_version():
+    """
+    Digest of the cache version, the scipy/numpy versions and this
+    script's code. Changes to the model or fit settings change it.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_CACHE_VERSION}:{scipy.__version__}:{np.__version__}".encode())
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _fit_digest(*arrays):
+    """
+    Digest of the arrays passed to curve_fit, used as the fit cache key.
+    Like the input cache key, it also covers _fit_version() so changes to
+    the model or fit settings force a refit.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_fit_version().encode())
+    for a in arrays:
+        a = np.ascontiguousarray(a, dtype=np.float64)
+        h.update(np.int64(a.size).tobytes())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def _extends(old_x, old_y, x, y):
+    """True if (old_x, old_y) is a leading slice of (x, y)."""
+    n = len(old_x)
+    return (len(old_y) == n and 0 < n <= len(x)
+            and np.array_equal(old_x, x[:n])
+            and np.array_equal(old_y, y[:n]))
+
+
+def load_fit_cache():
+    """
+    Return the cached fit as a dict with the digest, the code version,
+    both parameter sets and the fit windows they came from, or None.
+    """
+    if os.environ.get("KAPPA_NOCACHE") or not _fit_cache.exists():
+        return None
+    try:
+        with np.load(_fit_cache) as cached:
+            fit = {key: cached[key] for key in (
+                "popt_g_pre", "popt_g_post",
+                "x_pre", "y_pre", "x_post", "y_post"
+            )}
+            fit["digest"] = str(cached["digest"])
+            fit["version"] = str(cached["version"])
+    except Exception:
+        return None  # Damaged or unreadable cache; refit
+    if fit["popt_g_pre"].shape != (3,) or fit["popt_g_post"].shape != (3,):
+        return None
+    return fit
+
+
+def warm_start_params(cached, x_pre, y_pre, x_post, y_post):
+    """
+    Pick warm-start seeds from a stale fit cache.
+
+    A cached parameter set is only reused when it came from the same code
+    and its fit window is a prefix of the new one (i.e. new measurements
+    were appended); anything else, such as a moved split date or a
+    different data file, gets a cold fit.
+    """
+    if cached is None or cached["version"] != _fit_version():
+        return None, None
+    warm_pre = warm_post = None
+    if _extends(cached["x_pre"], cached["y_pre"], x_pre, y_pre):
+        warm_pre = cached["popt_g_pre"]
+    if _extends(cached["x_post"], cached["y_post"], x_post, y_post):
+        warm_post = cached["popt_g_post"]
+    return warm_pre, warm_post
+
+
+def save_fit_cache(digest, popt_g_pre, popt_g_post, x_pre, y_pre,
+                   x_post, y_post):
+    """Persist fitted parameters and their fit windows for later runs."""
+    if os.environ.get("KAPPA_NOCACHE"):
+        return
+    # Write to a temp file first so an interrupted save never leaves a
+    # truncated cache behind
+    tmp_path = _fit_cache.with_name(_fit_cache.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f, popt_g_pre=popt_g_pre, popt_g_post=popt_g_post,
+                x_pre=x_pre, y_pre=y_pre, x_post=x_post, y_post=y_post,
+                digest=np.array(digest), version=np.array(_fit_version())
+            )
+        os.replace(tmp_path, _fit_cache)
+    except OSError:
+        pass  # Caching is best-effort
+
+
 def format_notes(notes_data, **kwargs):
     """Format notes with dynamic values."""
-    formatted_sections = []
-    
+    lines = []
     for section in notes_data["sections"]:
-        section_text = f"{section['title']}\n"
-        for line in section["content"]:
-            formatted_line = line.format(**kwargs)
-            section_text += f"   {formatted_line}\n"
-        formatted_sections.append(section_text)
+        lines.append(section["title"])
+        lines.extend("   " + line.format_map(kwargs)
+                     for line in section["content"])
+        lines.append("")
     
-    return "\n".join(formatted_sections)
+    return "\n".join(lines)
 
 
 def main():
     # -- Data Loading ------------------------------------------------------
     print("Loading data from JSON files...")
-    data = load_data()
-    notes_data = load_notes()
-    
-    # Extract data from JSON - new structure with individual entries
-    measurements = data["measurements"]
-    settings = data["settings"]
-    
-    # Convert measurements to separate arrays
-    dates = [m["date"] for m in measurements]
-    kappa = [m["kappa"] for m in measurements]
-    lambda_ = [m["lambda"] for m in measurements]
-    
-    # Validate data
-    if not measurements:
-        raise ValueError("No measurements found in data file")
-    
-    # -- Data Preparation --------------------------------------------------
-    df = pd.DataFrame({
-        "Date": pd.to_datetime(dates),
-        "Kappa": kappa,
-        "Lambda": lambda_
-    })
-    df["Ratio"] = (df["Kappa"] / df["Lambda"]).round(2)
-    df["Delta"] = df["Kappa"].diff().fillna(0).round(1)
-    df["% Change"] = (
-        (df["Kappa"].pct_change().fillna(0) * 100)
-        .round(1).astype(str) + "%"
-    )
+    # Parsed measurements are reused from the cache when inputs are unchanged
+    df, settings, notes_data, input_digest = load_inputs()
+
+    # The numeric core works on plain arrays; the DataFrame is only needed
+    # for the table page
+    dates = df["Date"].to_numpy(dtype="datetime64[D]")
+    kappa = df["Kappa"].to_numpy(dtype=np.float64)
 
     # -- Model Fitting ----------------------------------------------------
-    split_date = datetime.fromisoformat(settings["split_date"])
-    df_pre = df[df["Date"] <= split_date]
-    df_post = df[df["Date"] >= split_date]
-
-    def gompertz(x, A, B, C):
-        return A * np.exp(-B * np.exp(-C * x))
-
-    # Pre-venetoclax Gompertz model
-    x_pre = (df_pre["Date"] - df_pre["Date"].min()).dt.days.values
-    popt_g_pre, _ = curve_fit(
-        gompertz, x_pre, df_pre["Kappa"],
-        p0=[df_pre["Kappa"].max(), 1, 0.05], maxfev=10000
-    )
+    split_date = np.datetime64(datetime.fromisoformat(settings["split_date"]))
+    pre = dates <= split_date
+    post = dates >= split_date
+    dates_pre, kappa_pre = dates[pre], kappa[pre]
+    dates_post, kappa_post = dates[post], kappa[post]
+    pre_start = dates_pre.min()
+    post_start = dates_post.min()
+
+    x_pre = (dates_pre - pre_start).astype(np.float64)
+    x_post = (dates_post - post_start).astype(np.float64)
+
+    # Only refit when the fit windows have changed
+    digest = _fit_digest(x_pre, kappa_pre, x_post, kappa_post)
+    cached = load_fit_cache()
+    if cached is not None and cached["digest"] == digest:
+        popt_g_pre = cached["popt_g_pre"]
+        popt_g_post = cached["popt_g_post"]
+    else:
+        # Warm-start from the previous fit when data has only been appended
+        warm_pre, warm_post = warm_start_params(
+            cached, x_pre, kappa_pre, x_post, kappa_post
+        )
+        # Pre-venetoclax Gompertz model
+        popt_g_pre = fit_gompertz(x_pre, kappa_pre, p0=warm_pre)
+        # Post-venetoclax Gompertz model
+        popt_g_post = fit_gompertz(x_post, kappa_post, p0=warm_post)
+        save_fit_cache(digest, popt_g_pre, popt_g_post,
+                       x_pre, kappa_pre, x_post, kappa_post)
 
     print("\nPre-Venetoclax Gompertz Parameters:")
     print(f"  A (asymptote): {popt_g_pre[0]:.1f} mg/L")
     print(f"  B (displacement): {popt_g_pre[1]:.3f}")
     print(f"  C (decay rate): {popt_g_pre[2]:.5f} /day")
 
-    # Post-venetoclax Gompertz model
-    x_post = (df_post["Date"] - df_post["Date"].min()).dt.days.values
-    popt_g_post, _ = curve_fit(
-        gompertz, x_post, df_post["Kappa"],
-        p0=[df_post["Kappa"].max(), 1, 0.05], maxfev=10000
-    )
-
     print("\nPost-Venetoclax Gompertz Parameters:")
     print(f"  A (asymptote): {popt_g_post[0]:.1f} mg/L")
     print(f"  B (displacement): {popt_g_post[1]:.3f}")
     print(f"  C (decay rate): {popt_g_post[2]:.5f} /day")
 
     # Projections
-    end = datetime.fromisoformat(settings["projection_end_date"])
-    pre_dates = pd.date_range(df_pre["Date"].min(), end)
-    post_dates = pd.date_range(df_post["Date"].min(), end)
-    proj_pre = gompertz((pre_dates - df_pre["Date"].min()).days, *popt_g_pre)
-    proj_post = gompertz(
-        (post_dates - df_post["Date"].min()).days, *popt_g_post
+    end = np.datetime64(
+        datetime.fromisoformat(settings["projection_end_date"]), "D"
     )
+    # Projections are daily, so the day offsets are simply 0..N-1
+    pre_dates = np.arange(pre_start, end + 1)
+    post_dates = np.arange(post_start, end + 1)
+    pre_days = np.arange(len(pre_dates), dtype=np.float64)
+    post_days = np.arange(len(post_dates), dtype=np.float64)
+    proj_pre = gompertz(pre_days, *popt_g_pre)
+    proj_post = gompertz(post_days, *popt_g_post)
 
     # Thresholds
     vgpr = settings["vgpr_threshold"]
     cr = settings["cr_threshold"]
-    vgpr_date = post_dates[np.where(proj_post < vgpr)[0][0]]
-    cr_date = post_dates[np.where(proj_post < cr)[0][0]]
+    mask_v = proj_post < vgpr
+    mask_c = proj_post < cr
+    if not mask_v.any() or not mask_c.any():
+        raise ValueError(
+            "Post-venetoclax projection does not reach the VGPR/CR "
+            "thresholds by projection_end_date. Please extend it in "
+            "the data file settings."
+        )
+    # datetime.date supports the strftime-style formats used in notes
+    vgpr_date = post_dates[int(mask_v.argmax())].astype(datetime)
+    cr_date = post_dates[int(mask_c.argmax())].astype(datetime)
 
     # -- PDF Report Generation -------------------------------------------
     # Create output directory in current working directory
     output_dir = Path.cwd()
-    latest_date = df["Date"].max().strftime("%Y-%m-%d")
+    latest_date = str(dates.max())
     filename = f"Kappa_Report_Through_{latest_date}_DetailedNotes.pdf"
     pdf_path = output_dir / filename
+
+    # Skip rendering when the inputs and fits match the existing report
+    manifest = None
+    manifest_path = output_dir / _manifest_name
+    # input_digest is None when caching is disabled, forcing a rebuild
+    if input_digest is not None:
+        manifest = _report_manifest(input_digest, popt_g_pre, popt_g_post)
+        try:
+            up_to_date = (pdf_path.exists()
+                          and manifest_path.read_text() == manifest)
+        except OSError:
+            up_to_date = False
+        if up_to_date:
+            print(f"Report up to date: {pdf_path}")
+            return
     
     print("Generating report...")
     print(f"Output location: {pdf_path}")
     
-    # Configure matplotlib for better PDF output
-    plt.rcParams['font.size'] = 9
-    plt.rcParams['axes.titlesize'] = 11
-    plt.rcParams['axes.labelsize'] = 9
-    plt.rcParams['legend.fontsize'] = 8
-    
     with PdfPages(pdf_path) as pdf:
-        # Page 1: Linear Scale Chart
+        # Pages 1 & 2: Linear and Log Scale Charts
         # 8.5x11" page with 0.5" margins: 7.5" wide x 10" tall usable area
-        fig, ax = plt.subplots(figsize=(7.5, 5.5))
-        ax.plot(df["Date"], df["Kappa"], 'o', markersize=4, label="Observed")
+        # Both pages share the same artists; only the y-axis scale differs,
+        # so draw once and save the figure twice. One figure is reused for
+        # every page; it is cleared and resized between pages.
+        fig = plt.figure(figsize=(7.5, 5.5))
+        ax = fig.add_subplot(111)
+        ax.plot(dates, kappa, 'o', markersize=4, label="Observed")
         ax.plot(pre_dates, proj_pre, '--', color='green', linewidth=2,
                 label="Pre-Ven Gompertz")
         ax.plot(post_dates, proj_post, '--', color='blue', linewidth=2,
@@ -182,75 +471,61 @@ def main():
         
         # Improve date formatting
         fig.autofmt_xdate()
-        plt.tight_layout()
-        pdf.savefig(bbox_inches='tight', dpi=300)
-        plt.close()
-
-        # Page 2: Log Scale Chart
-        fig, ax = plt.subplots(figsize=(7.5, 5.5))
-        ax.semilogy(df["Date"], df["Kappa"], 'o', markersize=4,
-                    label="Observed")
-        ax.semilogy(pre_dates, proj_pre, '--', color='green', linewidth=2,
-                    label="Pre-Ven Gompertz")
-        ax.semilogy(post_dates, proj_post, '--', color='blue', linewidth=2,
-                    label="Post-Ven Gompertz")
-        ax.axhline(vgpr, color='purple', linestyle=':', linewidth=1.5,
-                   label=f"VGPR (<{vgpr} mg/L)")
-        ax.axhline(cr, color='red', linestyle=':', linewidth=1.5,
-                   label=f"CR (<{cr} mg/L)")
-        ax.axvline(vgpr_date, color='purple', linestyle=':', alpha=0.7,
-                   label=f"VGPR by {vgpr_date:%b %d, %Y}")
-        ax.axvline(cr_date, color='red', linestyle=':', alpha=0.7,
-                   label=f"CR by {cr_date:%b %d, %Y}")
+        # Fixed margins for the chart pages avoid the extra render pass
+        # that tight_layout and bbox_inches='tight' each require
+        fig.subplots_adjust(left=0.11, right=0.97, top=0.91, bottom=0.14)
+        pdf.savefig(fig)
+
+        ax.set_yscale("log")
         ax.set_title("Kappa Light Chain: Log Scale with Projections",
                      fontsize=12, fontweight='bold', pad=15)
-        ax.set_xlabel("Date", fontsize=10)
         ax.set_ylabel("Kappa (mg/L, log scale)", fontsize=10)
         ax.grid(True, which='both', alpha=0.3)
-        ax.legend(fontsize=7, loc='upper right')
         
-        fig.autofmt_xdate()
-        plt.tight_layout()
-        pdf.savefig(bbox_inches='tight', dpi=300)
-        plt.close()
+        pdf.savefig(fig)
 
         # Page 3: Compressed Data Table
-        fig, ax = plt.subplots(figsize=(7.5, 9.5))
+        fig.clf()
+        fig.set_size_inches(7.5, 9.5)
+        ax = fig.add_subplot(111)
         ax.axis("off")
         
         # Create table with optimized column widths for 7.5" page
-        tbl = [["Date", "Kappa", "Lambda", "Ratio", "Δ", "%Δ"]] + [
-            [row["Date"].strftime("%m/%d"), f"{row['Kappa']:.1f}", 
-             f"{row['Lambda']:.1f}", f"{row['Ratio']:.1f}", 
-             f"{row['Delta']:+.1f}", row["% Change"]]
-            for _, row in df.iterrows()
-        ]
+        # Format whole columns at once rather than row by row
+        date_s = df["Date"].dt.strftime("%m/%d").to_numpy()
+        k_s = np.char.mod("%.1f", df["Kappa"].to_numpy())
+        l_s = np.char.mod("%.1f", df["Lambda"].to_numpy())
+        r_s = np.char.mod("%.1f", df["Ratio"].to_numpy())
+        d_s = np.char.mod("%+.1f", df["Delta"].to_numpy())
+        p_s = df["% Change"].to_numpy()
+        tbl = [["Date", "Kappa", "Lambda", "Ratio", "Δ", "%Δ"]] + np.stack(
+            [date_s, k_s, l_s, r_s, d_s, p_s], axis=1
+        ).tolist()
+        
+        # Header and alternating row colors, passed to the table up front
+        ncols = len(tbl[0])
+        cell_colours = np.full((len(tbl), ncols), "#ffffff", dtype=object)
+        cell_colours[0, :] = "#40466e"
+        cell_colours[2::2, :] = "#f8f9fa"
         
         # Optimized table for 7.5" width
         table = ax.table(
-            cellText=tbl, loc="center", cellLoc="center", 
+            cellText=tbl, cellColours=cell_colours.tolist(),
+            loc="center", cellLoc="center",
             colWidths=[0.15, 0.18, 0.18, 0.15, 0.15, 0.15]
         )
         table.auto_set_font_size(False)
         table.set_fontsize(8)
         table.scale(1, 1.4)
         
-        # Style header row
-        for i in range(len(tbl[0])):
-            table[(0, i)].set_facecolor('#40466e')
+        # Style header text
+        for i in range(ncols):
             table[(0, i)].set_text_props(weight='bold', color='white')
         
-        # Alternate row colors for better readability
-        for i in range(1, len(tbl)):
-            if i % 2 == 0:
-                for j in range(len(tbl[0])):
-                    table[(i, j)].set_facecolor('#f8f9fa')
-        
-        plt.title("Free Light Chain Results", fontsize=14,
-                  fontweight='bold', pad=25)
-        plt.tight_layout()
-        pdf.savefig(bbox_inches='tight', dpi=300)
-        plt.close()
+        ax.set_title("Free Light Chain Results", fontsize=14,
+                     fontweight='bold', pad=25)
+        fig.tight_layout()
+        pdf.savefig(fig, bbox_inches='tight')
 
         # Page 4: Detailed Notes
         formatted_notes = format_notes(
@@ -262,7 +537,9 @@ def main():
             cr_date=cr_date
         )
         
-        fig, ax = plt.subplots(figsize=(7.5, 10))
+        fig.clf()
+        fig.set_size_inches(7.5, 10)
+        ax = fig.add_subplot(111)
         ax.axis("off")
         
         # Title at top
@@ -273,9 +550,17 @@ def main():
         fig.text(0.1, 0.90, formatted_notes, fontsize=8, va="top",
                  wrap=True, verticalalignment='top')
         
-        plt.tight_layout()
-        pdf.savefig(bbox_inches='tight', dpi=300)
-        plt.close()
+        fig.tight_layout()
+        pdf.savefig(fig, bbox_inches='tight')
+        plt.close(fig)
+
+    if manifest is not None:
+        try:
+            tmp_path = manifest_path.with_name(_manifest_name + ".tmp")
+            tmp_path.write_text(manifest)
+            os.replace(tmp_path, manifest_path)
+        except OSError:
+            pass  # Caching is best-effort
 
     print(f"Report generated successfully: {pdf_path}")
     print(f"File size: {pdf_path.stat().st_size / 1024:.1f} KB")
@@ -5,37 +5,60 @@ This demonstrates how easy it is to update the data when new measurements
 come in.
 """
 
-import json
+from datetime import datetime
 
+from json_io import dump_json, load_json
 
-def add_new_data_point(date, kappa, lambda_val, data_file="data.json"):
+
+def add_new_data_points(points, data_file="data.json"):
     """
-    Add a new data point to the existing data file.
+    Add several data points to the data file in a single load/save.
     
     Args:
-        date: Date string in YYYY-MM-DD format
-        kappa: Kappa light chain value
-        lambda_val: Lambda light chain value
+        points: Iterable of (date, kappa, lambda_val) tuples, with dates
+            as strings in YYYY-MM-DD format
         data_file: Path to the data JSON file
     """
+    points = list(points)
+
+    # Validate every date up front so a bad entry never reaches the file
+    for date, _, _ in points:
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(
+                f"Invalid date '{date}'. Please use YYYY-MM-DD format."
+            )
+
     # Load existing data
-    with open(data_file, 'r') as f:
-        data = json.load(f)
+    data = load_json(data_file)
     
-    # Add new data point
-    new_measurement = {
-        "date": date,
-        "kappa": kappa,
-        "lambda": lambda_val
-    }
-    data["measurements"].append(new_measurement)
+    # Add new data points
+    data["measurements"].extend(
+        {"date": date, "kappa": kappa, "lambda": lambda_val}
+        for date, kappa, lambda_val in points
+    )
     
     # Save updated data
-    with open(data_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    dump_json(data, data_file)
     
-    msg = f"Added new data point: {date}, Kappa: {kappa}, Lambda: {lambda_val}"
-    print(msg)
+    for date, kappa, lambda_val in points:
+        msg = (f"Added new data point: {date}, Kappa: {kappa}, "
+               f"Lambda: {lambda_val}")
+        print(msg)
+
+
+def add_new_data_point(date, kappa, lambda_val, data_file="data.json"):
+    """
+    Add a new data point to the existing data file.
+    
+    Args:
+        date: Date string in YYYY-MM-DD format
+        kappa: Kappa light chain value
+        lambda_val: Lambda light chain value
+        data_file: Path to the data JSON file
+    """
+    add_new_data_points([(date, kappa, lambda_val)], data_file=data_file)
 
 
 def main():
@@ -77,9 +100,8 @@ def main():
     for date, kappa, lambda_val in new_data:
         print(f"# add_new_data_point('{date}', {kappa}, {lambda_val})")
     
-    print("\nOr add them all at once:")
-    print("# for date, kappa, lambda_val in new_data:")
-    print("#     add_new_data_point(date, kappa, lambda_val)")
+    print("\nOr add them all at once (one file read/write):")
+    print("# add_new_data_points(new_data)")
     
     print("\nAfter adding new data, run: python kappa_report.py")
 